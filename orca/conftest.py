@@ -0,0 +1,52 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+# supabase_client weigert te importeren zonder credentials; de tests vervangen de client toch
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+
+
+class FakeQuery:
+    """Neemt een PostgREST-keten op (select/eq/update/...) en geeft bij execute() het antwoord van de stub"""
+
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.calls = []
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args))
+            return self
+        return method
+
+    def called(self, name):
+        return [args for call, args in self.calls if call == name]
+
+    def execute(self):
+        self.client.executed.append(self)
+        return SimpleNamespace(data=self.client.respond(self))
+
+
+class FakeSupabase:
+    def __init__(self, respond=None):
+        self.respond = respond or (lambda query: [])
+        self.executed = []
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, fn, params):
+        query = FakeQuery(self, fn)
+        query.calls.append(("rpc", (params,)))
+        return query
+
+    def queries(self, table, call=None):
+        return [q for q in self.executed if q.table == table and (call is None or q.called(call))]
+
+
+@pytest.fixture
+def fake_supabase():
+    return FakeSupabase()
@@ -2,6 +2,7 @@ import os
 import json
 from dotenv import load_dotenv
 from supabase import create_client
+from production_rollups import record_order_line
 
 # ⬇️ Laad env-variabelen
 load_dotenv()
@@ -63,8 +64,13 @@ def import_structured_orders():
                     "quantity": product.get("quantity"),
                     "delivery_date": product.get("delivery_date"),
                     "unit": product.get("unit"),
+                    "is_exported": False,
                 }
-                supabase.table("order_lines").insert(line_data).execute()
+                inserted_line = supabase.table("order_lines").insert(line_data).execute().data[0]
+
+                # ⬇️ Werk productietotalen per leverdatum bij (op basis van de opgeslagen rij)
+                if not record_order_line(inserted_line, client_id):
+                    print(f"⚠️ Rollup niet bijgewerkt voor order_line {inserted_line.get('id')} — draai production_rollups.py om te herstellen")
 
             # ⬇️ Markeer originele mail als verwerkt
             supabase.table("emails").update({"structured_imported": True}).eq("id", email_id).execute()
@@ -2,7 +2,8 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from datetime import date
 import logging
 
 from order_pusher import create_trello_card, update_product_sent_status
@@ -11,6 +12,7 @@ from llm_parser import run as run_llm_parser
 from import_structured_orders import run as run_import_orders
 from supabase_client import supabase
 from get_clients import get_clients
+from production_rollups import get_production_rollups
 
 # 🔧 Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -95,4 +97,9 @@ def send_to_trello(request: SendOrderRequest):
 
 @app.get("/clients")
 def clients_endpoint():
-    return get_clients()
\ No newline at end of file
+    return get_clients()
+
+# 📊 Production totals per delivery date, client and product
+@app.get("/production-rollups")
+def production_rollups_endpoint(start_date: date, end_date: Optional[date] = None, client_id: Optional[int] = None):
+    return get_production_rollups(start_date, end_date, client_id)
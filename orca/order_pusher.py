@@ -109,7 +109,7 @@ def update_product_sent_status(product: Dict[str, Any], sent: bool = True) -> bo
         logger.info(f"Updating export status for order_line_id {order_line_id} to {sent}")
         
         # First, verify the order line exists
-        check_response = supabase.table('order_lines').select('id, product_name, is_exported').eq('id', order_line_id).is_('deleted_at', None).execute()
+        check_response = supabase.table('order_lines').select('id, product_name, quantity, delivery_date, unit, is_exported, orders(client_id)').eq('id', order_line_id).is_('deleted_at', None).execute()
         
         if not check_response.data:
             logger.error(f"Order line with id {order_line_id} not found in database")
@@ -118,19 +118,38 @@ def update_product_sent_status(product: Dict[str, Any], sent: bool = True) -> bo
         existing_line = check_response.data[0]
         logger.info(f"Found order line: {existing_line['product_name']} (current exported status: {existing_line['is_exported']})")
         
-        # Update the is_exported status directly using order_line_id
-        update_response = supabase.table('order_lines').update({
+        # Only flip the status if it is not already set, so concurrent requests update the rollup once.
+        # is_exported can be NULL for older lines, which counts as not exported.
+        update_query = supabase.table('order_lines').update({
             'is_exported': sent
-        }).eq('id', order_line_id).execute()
+        }).eq('id', order_line_id)
+        if sent:
+            update_query = update_query.or_('is_exported.is.null,is_exported.eq.false')
+        else:
+            update_query = update_query.eq('is_exported', True)
+        update_response = update_query.execute()
         
         logger.info(f"Update response: {update_response}")
         
         if update_response.data and len(update_response.data) > 0:
             updated_line = update_response.data[0]
             logger.info(f"Successfully updated order_line {order_line_id} exported status from {existing_line['is_exported']} to {updated_line['is_exported']}")
+
+            # Keep the production rollup in sync with the status change. Imported lazily so this
+            # module keeps working without Supabase credentials.
+            from production_rollups import record_export_change
+            client_id = (existing_line.get('orders') or {}).get('client_id')
+            if not record_export_change(updated_line, client_id, sent):
+                logger.warning(f"Production rollup not updated for order line {order_line_id}; run production_rollups.py to rebuild")
+            return True
+
+        # Nothing matched: the status may already have been set, possibly by a concurrent request
+        current_response = supabase.table('order_lines').select('is_exported').eq('id', order_line_id).execute()
+        if current_response.data and bool(current_response.data[0]['is_exported']) == sent:
+            logger.info(f"Order line {order_line_id} already has exported status {sent}")
             return True
         else:
-            logger.error(f"Update succeeded but no data returned for order line {order_line_id}")
+            logger.error(f"Could not set exported status of order line {order_line_id} to {sent}")
             logger.error(f"Update response: {update_response}")
             return False
             
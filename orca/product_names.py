@@ -0,0 +1,68 @@
+import re
+
+VOWELS = "aeiou"
+
+DIPHTHONGS = ("oe", "ui", "ie", "eu", "ei", "ij", "ou", "au")
+
+# Woord(uitgang)en die op een meervoudsuitgang eindigen maar geen meervoud zijn
+NON_PLURALS = (
+    "pils", "keuken", "volkoren", "granen", "gebakken", "gesneden",
+    "haver", "kaas", "ananas", "mais", "spelt",
+)
+
+
+def _singularize(word):
+    """
+    Zet een (Nederlands) meervoud om naar enkelvoud: broden → brood, bollen → bol.
+
+    Alleen duidelijke meervoudsvormen worden herschreven; bij twijfel blijft het woord staan.
+    """
+    if word.endswith(NON_PLURALS):
+        return word
+    if len(word) > 4 and word.endswith("jes"):
+        return word[:-1]
+    if len(word) > 4 and word.endswith("en"):
+        stem = word[:-2]
+        if len(stem) < 3 or stem[-1] in VOWELS:
+            return word
+        # Dubbele medeklinker: bollen → bol
+        if stem[-1] == stem[-2]:
+            return stem[:-1]
+        # Toonloze e: wortelen → wortel
+        if len(stem) > 3 and stem[-2] == "e" and stem[-1] in "lmr":
+            return stem
+        # Tweeklank blijft staan: koeken → koek, tompoezen → tompoes
+        if stem[-3:-1] in DIPHTHONGS:
+            pass
+        # Open lettergreep: broden → brood, kazen → kaas
+        elif stem[-2] in VOWELS and stem[-3] not in VOWELS:
+            stem = stem[:-1] + stem[-2] + stem[-1]
+        # Dubbele klinker voor één medeklinker is geen meervoudsvorm
+        elif stem[-2] in VOWELS:
+            return word
+        # Anders een medeklinkercluster: taarten → taart
+        if stem.endswith("z"):
+            stem = stem[:-1] + "s"
+        elif stem.endswith("v"):
+            stem = stem[:-1] + "f"
+        return stem
+    if len(word) > 5 and word.endswith("s") and word[-2] not in VOWELS + "s":
+        return word[:-1]
+    return word
+
+
+def normalize_product_name(name):
+    """
+    Normaliseer een productnaam tot een sleutel zodat bv. "brood" en "Broden" samenvallen.
+
+    Alleen het laatste woord (het zelfstandig naamwoord) wordt naar enkelvoud gezet,
+    zodat bijvoeglijke delen als "volkoren" of "gesneden" ongemoeid blijven.
+    """
+    if not name:
+        return ""
+    # Meervoud met apostrof: pizza's → pizza
+    name = re.sub(r"['’]s\b", "", str(name).lower())
+    words = re.findall(r"[a-z0-9à-ÿ]+", name)
+    if not words:
+        return ""
+    return " ".join(words[:-1] + [_singularize(words[-1])])
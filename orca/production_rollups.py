@@ -0,0 +1,203 @@
+import logging
+from fastapi.responses import JSONResponse
+from product_names import normalize_product_name
+from supabase_client import supabase
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Rollups worden bijgehouden in de tabel "production_rollups":
+#
+#   create table production_rollups (
+#       rollup_key        text primary key,  -- delivery_date|client_id|product_key|unit
+#       delivery_date     date not null,
+#       client_id         bigint,
+#       product_key       text not null,
+#       product_name      text,
+#       unit              text,
+#       total_quantity    numeric not null default 0,
+#       exported_quantity numeric not null default 0,
+#       line_count        integer not null default 0,
+#       updated_at        timestamptz default now()
+#   );
+#   create index on production_rollups (delivery_date);
+#
+# Ophogen gebeurt atomair in de database via:
+#
+#   create or replace function increment_production_rollup(
+#       p_rollup_key text, p_delivery_date date, p_client_id bigint, p_product_key text,
+#       p_product_name text, p_unit text, p_total_quantity numeric,
+#       p_exported_quantity numeric, p_line_count integer
+#   ) returns void language sql as $$
+#       insert into production_rollups (rollup_key, delivery_date, client_id, product_key,
+#           product_name, unit, total_quantity, exported_quantity, line_count, updated_at)
+#       values (p_rollup_key, p_delivery_date, p_client_id, p_product_key, p_product_name,
+#           p_unit, p_total_quantity, p_exported_quantity, p_line_count, now())
+#       on conflict (rollup_key) do update set
+#           total_quantity = production_rollups.total_quantity + excluded.total_quantity,
+#           exported_quantity = production_rollups.exported_quantity + excluded.exported_quantity,
+#           line_count = production_rollups.line_count + excluded.line_count,
+#           product_name = coalesce(production_rollups.product_name, excluded.product_name),
+#           updated_at = now();
+#   $$;
+
+ROLLUP_TABLE = "production_rollups"
+
+PAGE_SIZE = 1000
+
+
+def _to_quantity(value):
+    try:
+        return float(value) if value is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _rollup_key(delivery_date, client_id, product_key, unit):
+    return f"{delivery_date}|{client_id if client_id is not None else ''}|{product_key}|{unit or ''}"
+
+
+def apply_line_delta(line, client_id, quantity_delta=0.0, exported_delta=0.0, line_delta=0):
+    """
+    Verwerk één order_line incrementeel in de rollup voor (leverdatum, klant, product, eenheid).
+
+    Returns:
+        bool: True als de rollup is bijgewerkt
+    """
+    delivery_date = line.get("delivery_date")
+    product_key = normalize_product_name(line.get("product_name"))
+    if not delivery_date or not product_key:
+        logger.warning(f"⚠️ Order line zonder leverdatum of product overgeslagen voor rollup: {line}")
+        return False
+
+    unit = (line.get("unit") or "").strip().lower()
+    rollup_key = _rollup_key(delivery_date, client_id, product_key, unit)
+
+    try:
+        supabase.rpc("increment_production_rollup", {
+            "p_rollup_key": rollup_key,
+            "p_delivery_date": delivery_date,
+            "p_client_id": client_id,
+            "p_product_key": product_key,
+            "p_product_name": line.get("product_name"),
+            "p_unit": unit,
+            "p_total_quantity": quantity_delta,
+            "p_exported_quantity": exported_delta,
+            "p_line_count": line_delta,
+        }).execute()
+        return True
+    except Exception as e:
+        logger.error(f"❌ Fout bij bijwerken van rollup {rollup_key}: {e}", exc_info=True)
+        return False
+
+
+def record_order_line(line, client_id):
+    """Tel een nieuw ingevoerde order_line op bij de rollup"""
+    return apply_line_delta(line, client_id, quantity_delta=_to_quantity(line.get("quantity")), line_delta=1)
+
+
+def record_export_change(line, client_id, exported):
+    """Verwerk een gewijzigde exportstatus van een order_line in de rollup"""
+    quantity = _to_quantity(line.get("quantity"))
+    return apply_line_delta(line, client_id, exported_delta=quantity if exported else -quantity)
+
+
+def get_production_rollups(start_date, end_date=None, client_id=None):
+    """
+    Haal de productietotalen per leverdatum, klant en product op.
+
+    Returns:
+        dict: Success response with rollups list
+        JSONResponse: Error response with status code and message
+    """
+    end_date = end_date or start_date
+    if end_date < start_date:
+        return JSONResponse(status_code=422, content={"status": "error", "message": "end_date must not be before start_date"})
+
+    def query():
+        builder = supabase.table(ROLLUP_TABLE) \
+            .select("delivery_date, client_id, product_key, product_name, unit, total_quantity, exported_quantity, line_count") \
+            .gte("delivery_date", start_date.isoformat()) \
+            .lte("delivery_date", end_date.isoformat())
+        if client_id is not None:
+            builder = builder.eq("client_id", client_id)
+        return builder.order("delivery_date").order("rollup_key")
+
+    try:
+        return {"rollups": _fetch_all(query)}
+    except Exception as e:
+        logger.error(f"❌ Error fetching production rollups: {e}", exc_info=True)
+        return JSONResponse(status_code=500, content={"status": "error", "message": str(e)})
+
+
+def _fetch_all(query_builder):
+    """Haal alle rijen op in pagina's, omdat PostgREST het aantal rijen per response begrenst"""
+    rows = []
+    offset = 0
+    while True:
+        page = query_builder().range(offset, offset + PAGE_SIZE - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        offset += PAGE_SIZE
+
+
+def rebuild_rollups():
+    """
+    Bouw alle rollups opnieuw op uit order_lines (eenmalige backfill of herstel).
+
+    Nieuwe waarden worden eerst ge-upsert en pas daarna worden verdwenen sleutels verwijderd,
+    zodat /production-rollups tijdens de rebuild nooit leeg is.
+
+    Let op: de rebuild schrijft absolute totalen uit een momentopname van order_lines.
+    Ophogingen door imports of exports die tijdens de rebuild lopen worden daarbij
+    overschreven, dus pauzeer /process-all en /send-to-trello zolang dit draait.
+    """
+    lines = _fetch_all(lambda: supabase.table("order_lines")
+                       .select("id, product_name, quantity, delivery_date, unit, is_exported, orders(client_id)")
+                       .is_("deleted_at", None)
+                       .order("id"))
+
+    rollups = {}
+    for line in lines:
+        delivery_date = line.get("delivery_date")
+        product_key = normalize_product_name(line.get("product_name"))
+        if not delivery_date or not product_key:
+            continue
+
+        client_id = (line.get("orders") or {}).get("client_id")
+        unit = (line.get("unit") or "").strip().lower()
+        rollup_key = _rollup_key(delivery_date, client_id, product_key, unit)
+        rollup = rollups.setdefault(rollup_key, {
+            "rollup_key": rollup_key,
+            "delivery_date": delivery_date,
+            "client_id": client_id,
+            "product_key": product_key,
+            "product_name": line.get("product_name"),
+            "unit": unit,
+            "total_quantity": 0.0,
+            "exported_quantity": 0.0,
+            "line_count": 0,
+        })
+        quantity = _to_quantity(line.get("quantity"))
+        rollup["total_quantity"] += quantity
+        if line.get("is_exported"):
+            rollup["exported_quantity"] += quantity
+        rollup["line_count"] += 1
+
+    values = list(rollups.values())
+    for i in range(0, len(values), PAGE_SIZE):
+        supabase.table(ROLLUP_TABLE).upsert(values[i:i + PAGE_SIZE], on_conflict="rollup_key").execute()
+
+    existing_keys = {row["rollup_key"] for row in _fetch_all(
+        lambda: supabase.table(ROLLUP_TABLE).select("rollup_key").order("rollup_key"))}
+    stale_keys = sorted(existing_keys - rollups.keys())
+    for i in range(0, len(stale_keys), 100):
+        supabase.table(ROLLUP_TABLE).delete().in_("rollup_key", stale_keys[i:i + 100]).execute()
+
+    print(f"📊 Rollups opnieuw opgebouwd: {len(rollups)} uit {len(lines)} order lines, {len(stale_keys)} verwijderd")
+    return len(rollups)
+
+
+if __name__ == "__main__":
+    rebuild_rollups()
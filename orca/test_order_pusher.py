@@ -0,0 +1,74 @@
+import pytest
+
+import order_pusher
+import production_rollups
+
+LINE = {
+    "id": 42, "product_name": "Broden", "quantity": 4, "delivery_date": "2025-06-01",
+    "unit": "stuks", "orders": {"client_id": 7},
+}
+
+
+@pytest.fixture
+def stub(monkeypatch, fake_supabase):
+    monkeypatch.setattr(order_pusher, "supabase", fake_supabase)
+    monkeypatch.setattr(production_rollups, "supabase", fake_supabase)
+    return fake_supabase
+
+
+def _respond(existing, updated, current):
+    def respond(query):
+        if query.table != "order_lines":
+            return []
+        if query.called("update"):
+            return updated
+        if query.called("select") == [("is_exported",)]:
+            return current
+        return [existing]
+    return respond
+
+
+def _exported_deltas(stub):
+    return [q.called("rpc")[0][0]["p_exported_quantity"] for q in stub.queries("increment_production_rollup")]
+
+
+def test_export_of_null_status_line_updates_rollup(stub):
+    stub.respond = _respond(dict(LINE, is_exported=None), [dict(LINE, is_exported=True)], [])
+
+    assert order_pusher.update_product_sent_status({"order_line_id": 42})
+
+    update = stub.queries("order_lines", "update")[0]
+    assert update.called("or_") == [("is_exported.is.null,is_exported.eq.false",)]
+    assert _exported_deltas(stub) == [4.0]
+
+
+def test_unexport_only_matches_exported_lines(stub):
+    stub.respond = _respond(dict(LINE, is_exported=True), [dict(LINE, is_exported=False)], [])
+
+    assert order_pusher.update_product_sent_status({"order_line_id": 42}, sent=False)
+
+    update = stub.queries("order_lines", "update")[0]
+    assert update.called("eq") == [("id", 42), ("is_exported", True)]
+    assert _exported_deltas(stub) == [-4.0]
+
+
+def test_concurrent_export_does_not_count_twice(stub):
+    # De status was al gezet door een ander verzoek: de conditionele update raakt geen rij
+    stub.respond = _respond(dict(LINE, is_exported=False), [], [{"is_exported": True}])
+
+    assert order_pusher.update_product_sent_status({"order_line_id": 42})
+    assert _exported_deltas(stub) == []
+
+
+def test_unexport_of_null_status_line_is_a_no_op(stub):
+    stub.respond = _respond(dict(LINE, is_exported=None), [], [{"is_exported": None}])
+
+    assert order_pusher.update_product_sent_status({"order_line_id": 42}, sent=False)
+    assert _exported_deltas(stub) == []
+
+
+def test_failed_update_returns_false(stub):
+    stub.respond = _respond(dict(LINE, is_exported=False), [], [{"is_exported": False}])
+
+    assert not order_pusher.update_product_sent_status({"order_line_id": 42})
+    assert _exported_deltas(stub) == []
@@ -0,0 +1,35 @@
+import pytest
+
+from product_names import normalize_product_name
+
+
+@pytest.mark.parametrize("plural, singular", [
+    ("Broden", "brood"),
+    ("bollen", "bol"),
+    ("kazen", "kaas"),
+    ("krentenbollen", "krentenbol"),
+    ("taarten", "taart"),
+    ("broodjes", "broodje"),
+    ("croissants", "croissant"),
+    ("Volkoren broden", "volkoren brood"),
+    ("koeken", "koek"),
+    ("beschuiten", "beschuit"),
+    ("tompoezen", "tompoes"),
+    ("wortelen", "wortel"),
+    ("pizza's", "pizza"),
+])
+def test_plurals_aggregate_with_singular(plural, singular):
+    assert normalize_product_name(plural) == normalize_product_name(singular) == singular
+
+
+@pytest.mark.parametrize("name", [
+    "pils", "keuken", "volkoren", "volkoren brood", "gesneden wit", "kaas",
+    "ongesneden", "halfgebakken",
+])
+def test_singular_words_are_left_alone(name):
+    assert normalize_product_name(name) == name
+
+
+def test_empty_name():
+    assert normalize_product_name(None) == ""
+    assert normalize_product_name("  ") == ""
@@ -0,0 +1,120 @@
+from datetime import date
+
+import production_rollups
+
+
+def _rpc_params(fake_supabase):
+    return [q.called("rpc")[0][0] for q in fake_supabase.queries("increment_production_rollup")]
+
+
+def test_record_order_line_increments_total(monkeypatch, fake_supabase):
+    monkeypatch.setattr(production_rollups, "supabase", fake_supabase)
+    line = {"product_name": "Broden", "quantity": "12", "delivery_date": "2025-06-01", "unit": " Stuks "}
+
+    assert production_rollups.record_order_line(line, 7)
+
+    assert _rpc_params(fake_supabase) == [{
+        "p_rollup_key": "2025-06-01|7|brood|stuks",
+        "p_delivery_date": "2025-06-01",
+        "p_client_id": 7,
+        "p_product_key": "brood",
+        "p_product_name": "Broden",
+        "p_unit": "stuks",
+        "p_total_quantity": 12.0,
+        "p_exported_quantity": 0.0,
+        "p_line_count": 1,
+    }]
+
+
+def test_record_export_change_adds_and_removes_exported_quantity(monkeypatch, fake_supabase):
+    monkeypatch.setattr(production_rollups, "supabase", fake_supabase)
+    line = {"product_name": "brood", "quantity": 5, "delivery_date": "2025-06-01", "unit": None}
+
+    production_rollups.record_export_change(line, None, True)
+    production_rollups.record_export_change(line, None, False)
+
+    params = _rpc_params(fake_supabase)
+    assert [p["p_exported_quantity"] for p in params] == [5.0, -5.0]
+    assert all(p["p_total_quantity"] == 0.0 and p["p_line_count"] == 0 for p in params)
+    assert params[0]["p_rollup_key"] == "2025-06-01||brood|"
+
+
+def test_line_without_delivery_date_is_skipped(monkeypatch, fake_supabase):
+    monkeypatch.setattr(production_rollups, "supabase", fake_supabase)
+
+    assert not production_rollups.record_order_line({"product_name": "brood", "quantity": 1}, 7)
+    assert fake_supabase.executed == []
+
+
+def test_rpc_failure_returns_false(monkeypatch, fake_supabase):
+    def respond(query):
+        raise RuntimeError("connection lost")
+    fake_supabase.respond = respond
+    monkeypatch.setattr(production_rollups, "supabase", fake_supabase)
+
+    line = {"product_name": "brood", "quantity": 1, "delivery_date": "2025-06-01"}
+    assert not production_rollups.record_order_line(line, 7)
+
+
+def test_get_production_rollups_rejects_end_before_start(monkeypatch, fake_supabase):
+    monkeypatch.setattr(production_rollups, "supabase", fake_supabase)
+
+    response = production_rollups.get_production_rollups(date(2025, 6, 2), date(2025, 6, 1))
+
+    assert response.status_code == 422
+    assert fake_supabase.executed == []
+
+
+def test_get_production_rollups_pages_through_results(monkeypatch, fake_supabase):
+    monkeypatch.setattr(production_rollups, "PAGE_SIZE", 2)
+    rows = [{"rollup_key": str(i)} for i in range(3)]
+    fake_supabase.respond = lambda query: rows[query.called("range")[0][0]:query.called("range")[0][1] + 1]
+    monkeypatch.setattr(production_rollups, "supabase", fake_supabase)
+
+    response = production_rollups.get_production_rollups(date(2025, 6, 1), client_id=7)
+
+    assert response == {"rollups": rows}
+    query = fake_supabase.executed[0]
+    assert query.called("gte") == [("delivery_date", "2025-06-01")]
+    assert query.called("lte") == [("delivery_date", "2025-06-01")]
+    assert query.called("eq") == [("client_id", 7)]
+
+
+def test_rebuild_rollups_sums_lines_and_deletes_stale_keys(monkeypatch, fake_supabase):
+    lines = [
+        {"product_name": "brood", "quantity": 3, "delivery_date": "2025-06-01", "unit": "stuks",
+         "is_exported": True, "orders": {"client_id": 7}},
+        {"product_name": "Broden", "quantity": "2", "delivery_date": "2025-06-01", "unit": "Stuks",
+         "is_exported": None, "orders": {"client_id": 7}},
+        {"product_name": "bol", "quantity": 1, "delivery_date": None, "unit": "stuks",
+         "is_exported": False, "orders": {"client_id": 7}},
+    ]
+
+    def respond(query):
+        if query.table == "order_lines":
+            return lines
+        if query.called("select"):
+            return [{"rollup_key": "2025-06-01|7|brood|stuks"}, {"rollup_key": "2025-05-01|7|bol|stuks"}]
+        return []
+    fake_supabase.respond = respond
+    monkeypatch.setattr(production_rollups, "supabase", fake_supabase)
+
+    assert production_rollups.rebuild_rollups() == 1
+
+    upserted = fake_supabase.queries("production_rollups", "upsert")[0].called("upsert")[0][0]
+    assert upserted == [{
+        "rollup_key": "2025-06-01|7|brood|stuks",
+        "delivery_date": "2025-06-01",
+        "client_id": 7,
+        "product_key": "brood",
+        "product_name": "brood",
+        "unit": "stuks",
+        "total_quantity": 5.0,
+        "exported_quantity": 3.0,
+        "line_count": 2,
+    }]
+    deletes = fake_supabase.queries("production_rollups", "delete")
+    assert [q.called("in_") for q in deletes] == [[("rollup_key", ["2025-05-01|7|bol|stuks"])]]
+    # Upsert gebeurt vóór het verwijderen, zodat de endpoint nooit leeg is
+    assert fake_supabase.executed.index(deletes[0]) > fake_supabase.executed.index(
+        fake_supabase.queries("production_rollups", "upsert")[0])